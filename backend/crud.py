@@ -2,12 +2,34 @@
 CRUD operations for HRMS Lite.
 Handles database operations for employees and attendance records.
 """
+from sqlalchemy import delete, lambda_stmt, select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
-from models import Employee, Attendance, AttendanceStatus
+from models import Employee, Attendance
 from schemas import EmployeeCreate, AttendanceCreate
 from datetime import date
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import threading
+import time
+
+
+# Seconds a confirmed employee_id is trusted without re-querying the database
+EMPLOYEE_CACHE_TTL = 60
+
+# employee_id -> monotonic time the employee was last seen in the database
+_employee_cache: Dict[str, float] = {}
+
+# Bumped on every invalidation so lookups started before a write don't repopulate the cache
+_cache_generation: Dict[str, int] = {"employees": 0, "dashboard": 0}
+
+# Guards compare-and-store against concurrent invalidation
+_cache_lock = threading.Lock()
+
+# Seconds dashboard statistics are served from memory before being recomputed
+DASHBOARD_CACHE_TTL = 30
+
+# "stats" -> (monotonic time computed, dashboard statistics payload)
+_dashboard_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
 
 
 class DuplicateEmployeeError(Exception):
@@ -20,6 +42,83 @@ class EmployeeNotFoundError(Exception):
     pass
 
 
+def _is_employee_cached(employee_id: str) -> bool:
+    """Return True if employee_id was confirmed to exist within the cache TTL."""
+    seen = _employee_cache.get(employee_id)
+    return seen is not None and time.monotonic() - seen < EMPLOYEE_CACHE_TTL
+
+
+def _remember_employees(employee_ids: Iterable[str], generation: int) -> None:
+    """Cache employee_ids as existing unless the cache was invalidated since generation."""
+    now = time.monotonic()
+    with _cache_lock:
+        if _cache_generation["employees"] == generation:
+            for employee_id in employee_ids:
+                _employee_cache[employee_id] = now
+
+
+def _forget_employee(employee_id: str) -> None:
+    """Drop employee_id from the existence cache after the employee changes."""
+    with _cache_lock:
+        _employee_cache.pop(employee_id, None)
+        _cache_generation["employees"] += 1
+
+
+def employee_exists(db: Session, employee_id: str, generation: Optional[int] = None) -> bool:
+    """
+    Check whether an employee exists, using a short-lived in-process cache.
+    
+    Args:
+        db: Database session
+        employee_id: ID of employee
+        generation: Cache generation read before the session's transaction began,
+            when the caller has already queried in this transaction
+        
+    Returns:
+        True if the employee exists, False otherwise
+    """
+    if _is_employee_cached(employee_id):
+        return True
+    
+    if generation is None:
+        generation = _cache_generation["employees"]
+    # lambda_stmt caches the constructed statement; employee_id becomes a bound parameter
+    exists = db.execute(lambda_stmt(
+        lambda: select(Employee.employee_id).where(Employee.employee_id == employee_id)
+    )).scalar()
+    if exists:
+        _remember_employees([employee_id], generation)
+        return True
+    return False
+
+
+def get_cached_dashboard_stats() -> Optional[Dict[str, Any]]:
+    """Return cached dashboard statistics if they are younger than the cache TTL."""
+    cached = _dashboard_cache.get("stats")
+    if cached and time.monotonic() - cached[0] < DASHBOARD_CACHE_TTL:
+        return cached[1]
+    return None
+
+
+def dashboard_stats_generation() -> int:
+    """Return the current dashboard cache generation; read it before computing statistics."""
+    return _cache_generation["dashboard"]
+
+
+def cache_dashboard_stats(stats: Dict[str, Any], generation: int) -> None:
+    """Store freshly computed dashboard statistics unless a write invalidated them meanwhile."""
+    with _cache_lock:
+        if _cache_generation["dashboard"] == generation:
+            _dashboard_cache["stats"] = (time.monotonic(), stats)
+
+
+def invalidate_dashboard_stats() -> None:
+    """Drop cached dashboard statistics after employee or attendance changes."""
+    with _cache_lock:
+        _dashboard_cache.pop("stats", None)
+        _cache_generation["dashboard"] += 1
+
+
 def create_employee(db: Session, employee: EmployeeCreate) -> Employee:
     """
     Create a new employee record.
@@ -34,12 +133,7 @@ def create_employee(db: Session, employee: EmployeeCreate) -> Employee:
     Raises:
         DuplicateEmployeeError: If employee_id already exists
     """
-    # Check if employee_id already exists
-    existing = db.query(Employee).filter(Employee.employee_id == employee.employee_id).first()
-    if existing:
-        raise DuplicateEmployeeError(f"Employee with ID {employee.employee_id} already exists")
-    
-    # Create new employee
+    # Create new employee; duplicates are detected by the primary key constraint
     db_employee = Employee(
         employee_id=employee.employee_id,
         name=employee.name,
@@ -50,7 +144,8 @@ def create_employee(db: Session, employee: EmployeeCreate) -> Employee:
     try:
         db.add(db_employee)
         db.commit()
-        db.refresh(db_employee)
+        _forget_employee(employee.employee_id)
+        invalidate_dashboard_stats()
         return db_employee
     except IntegrityError:
         db.rollback()
@@ -70,7 +165,7 @@ def get_all_employees(db: Session) -> List[Employee]:
     return db.query(Employee).all()
 
 
-def delete_employee(db: Session, employee_id: str) -> bool:
+def delete_employee(db: Session, employee_id: str) -> int:
     """
     Delete an employee and all associated attendance records (cascade delete).
     
@@ -79,15 +174,15 @@ def delete_employee(db: Session, employee_id: str) -> bool:
         employee_id: ID of employee to delete
         
     Returns:
-        True if employee was deleted, False if not found
+        Number of employees deleted (0 if not found)
     """
-    employee = db.query(Employee).filter(Employee.employee_id == employee_id).first()
-    if not employee:
-        return False
-    
-    db.delete(employee)
+    # Attendance rows are removed by the ON DELETE CASCADE foreign key
+    result = db.execute(delete(Employee).where(Employee.employee_id == employee_id))
     db.commit()
-    return True
+    if result.rowcount:
+        _forget_employee(employee_id)
+        invalidate_dashboard_stats()
+    return result.rowcount
 
 
 def create_attendance(db: Session, attendance: AttendanceCreate) -> Attendance:
@@ -104,34 +199,89 @@ def create_attendance(db: Session, attendance: AttendanceCreate) -> Attendance:
     Raises:
         EmployeeNotFoundError: If employee does not exist
     """
-    # Verify employee exists
-    employee = db.query(Employee).filter(Employee.employee_id == attendance.employee_id).first()
-    if not employee:
-        raise EmployeeNotFoundError(f"Employee with ID {attendance.employee_id} not found")
-    
-    # Convert status string to enum
-    status_enum = AttendanceStatus.Present if attendance.status == "Present" else AttendanceStatus.Absent
-    
     # Create attendance record
     db_attendance = Attendance(
         employee_id=attendance.employee_id,
         date=attendance.date,
-        status=status_enum
+        status=attendance.status
     )
     
-    db.add(db_attendance)
-    db.commit()
-    db.refresh(db_attendance)
-    return db_attendance
+    # The foreign key on employee_id rejects records for unknown employees
+    try:
+        db.add(db_attendance)
+        db.commit()
+        invalidate_dashboard_stats()
+        return db_attendance
+    except IntegrityError:
+        db.rollback()
+        raise EmployeeNotFoundError(f"Employee with ID {attendance.employee_id} not found")
 
 
-def get_attendance_by_employee(db: Session, employee_id: str) -> List[Attendance]:
+def create_attendance_bulk(db: Session, items: List[AttendanceCreate]) -> int:
     """
-    Retrieve all attendance records for a specific employee, sorted by date descending.
+    Create many attendance records in a single INSERT.
+    
+    Args:
+        db: Database session
+        items: Attendance data to create
+        
+    Returns:
+        Number of attendance records created
+        
+    Raises:
+        EmployeeNotFoundError: If any referenced employee does not exist
+    """
+    if not items:
+        return 0
+    
+    # Verify all referenced employees exist, querying only those not recently seen
+    unchecked = {item.employee_id for item in items if not _is_employee_cached(item.employee_id)}
+    if unchecked:
+        generation = _cache_generation["employees"]
+        found = {
+            row.employee_id for row in
+            db.query(Employee.employee_id).filter(Employee.employee_id.in_(unchecked))
+        }
+        missing = sorted(unchecked - found)
+        if missing:
+            raise EmployeeNotFoundError(f"Employees with IDs {', '.join(missing)} not found")
+        _remember_employees(found, generation)
+    
+    # Insert all records without per-object ORM state tracking; the foreign key
+    # still rejects employees deleted since the check above
+    try:
+        db.bulk_insert_mappings(Attendance, [
+            {
+                "employee_id": item.employee_id,
+                "date": item.date,
+                "status": item.status
+            }
+            for item in items
+        ])
+        db.commit()
+        invalidate_dashboard_stats()
+        return len(items)
+    except IntegrityError:
+        db.rollback()
+        for item in items:
+            _forget_employee(item.employee_id)
+        raise EmployeeNotFoundError("One or more referenced employees not found")
+
+
+def get_attendance_by_employee(
+    db: Session,
+    employee_id: str,
+    skip: int = 0,
+    limit: int = 100
+) -> List[Attendance]:
+    """
+    Retrieve a page of attendance records for a specific employee, sorted by date descending.
     
     Args:
         db: Database session
         employee_id: ID of employee
+        skip: Number of records to skip
+        limit: Maximum number of records to return
         
     Returns:
         List of attendance records sorted by date (newest first)
@@ -139,12 +289,18 @@ def get_attendance_by_employee(db: Session, employee_id: str) -> List[Attendance
     Raises:
         EmployeeNotFoundError: If employee does not exist
     """
-    # Verify employee exists
-    employee = db.query(Employee).filter(Employee.employee_id == employee_id).first()
-    if not employee:
+    # Read before the first query so a delete committed mid-request isn't cached over
+    generation = _cache_generation["employees"]
+    
+    # Get attendance records sorted by date descending; id breaks ties so pages are stable
+    records = db.execute(lambda_stmt(
+        lambda: select(Attendance).where(
+            Attendance.employee_id == employee_id
+        ).order_by(Attendance.date.desc(), Attendance.id.desc()).offset(skip).limit(limit)
+    )).scalars().all()
+    
+    # Only check the employee exists when there are no records to return
+    if not records and not employee_exists(db, employee_id, generation):
         raise EmployeeNotFoundError(f"Employee with ID {employee_id} not found")
     
-    # Get attendance records sorted by date descending
-    return db.query(Attendance).filter(
-        Attendance.employee_id == employee_id
-    ).order_by(Attendance.date.desc()).all()
+    return records
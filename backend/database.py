@@ -43,11 +43,21 @@ DATABASE_URL = get_database_url()
 print(f"[DB] Connecting to: {DATABASE_URL}")  # helpful for debugging in Railway logs
 
 # Create SQLAlchemy engine
-# Set echo=False in production for better performance
-engine = create_engine(DATABASE_URL, echo=False)
+# Pool is sized for concurrent FastAPI workers; pre_ping and recycle guard
+# against connections dropped by the MySQL server. Set SQL_DEBUG to log SQL.
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    echo=os.getenv("SQL_DEBUG", "").lower() in ("1", "true", "yes")
+)
 
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Objects stay loaded after commit so responses can be built without a reload
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 # Base class for models
 Base = declarative_base()
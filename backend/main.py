@@ -3,60 +3,69 @@ FastAPI application for HRMS Lite backend.
 Provides REST API endpoints for employee and attendance management.
 """
 import os
-from fastapi import FastAPI, Depends, HTTPException, status
+from fastapi import APIRouter, FastAPI, Depends, HTTPException, Query, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from database import get_db, init_db
 from models import Employee, Attendance, AttendanceStatus
-from schemas import EmployeeCreate, EmployeeResponse, AttendanceCreate, AttendanceResponse
+from schemas import (
+    EmployeeCreate,
+    EmployeeResponse,
+    AttendanceCreate,
+    AttendanceResponse,
+    AttendanceBulkResponse
+)
 from crud import (
     create_employee,
     get_all_employees,
     delete_employee,
     create_attendance,
+    create_attendance_bulk,
     get_attendance_by_employee,
+    get_cached_dashboard_stats,
+    dashboard_stats_generation,
+    cache_dashboard_stats,
     DuplicateEmployeeError,
     EmployeeNotFoundError
 )
 
-# Initialize FastAPI app
-app = FastAPI(
-    title="HRMS Lite API",
-    description="REST API for Human Resource Management System",
-    version="1.0.0"
-)
+# Upper bound on the page size a client may request for attendance history
+MAX_ATTENDANCE_PAGE_SIZE = 500
 
-# Configure CORS
-origins = [
-    "http://localhost:5173",  # Local development frontend
-    os.getenv("FRONTEND_URL", ""),  # Production frontend URL
-]
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Routes are collected on a router and mounted by create_app
+router = APIRouter()
+
+
+def get_cors_origins(frontend_url: Optional[str] = None) -> List[str]:
+    """
+    Build the list of origins allowed by CORS.
+    
+    Args:
+        frontend_url: Production frontend URL, defaults to the FRONTEND_URL env variable
+        
+    Returns:
+        Local development frontend plus the production frontend URL, when set
+    """
+    if frontend_url is None:
+        frontend_url = os.getenv("FRONTEND_URL")
+    return [origin for origin in ("http://localhost:5173", frontend_url) if origin]
 
 
-@app.on_event("startup")
 def startup_event():
     """Initialize database on application startup."""
     init_db()
 
 
-@app.get("/")
-def read_root():
+@router.get("/")
+async def read_root():
     """Health check endpoint."""
     return {"status": "ok", "message": "HRMS Lite API is running"}
 
 
-@app.post("/employees", response_model=EmployeeResponse, status_code=status.HTTP_201_CREATED)
+@router.post("/employees", response_model=EmployeeResponse, status_code=status.HTTP_201_CREATED)
 def create_employee_endpoint(employee: EmployeeCreate, db: Session = Depends(get_db)):
     """
     Create a new employee record.
@@ -76,7 +85,7 @@ def create_employee_endpoint(employee: EmployeeCreate, db: Session = Depends(get
         )
 
 
-@app.get("/employees", response_model=List[EmployeeResponse])
+@router.get("/employees", response_model=List[EmployeeResponse])
 def get_employees_endpoint(db: Session = Depends(get_db)):
     """
     Retrieve all employee records.
@@ -88,7 +97,7 @@ def get_employees_endpoint(db: Session = Depends(get_db)):
     return employees
 
 
-@app.delete("/employees/{employee_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete("/employees/{employee_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_employee_endpoint(employee_id: str, db: Session = Depends(get_db)):
     """
     Delete an employee and all associated attendance records.
@@ -105,7 +114,7 @@ def delete_employee_endpoint(employee_id: str, db: Session = Depends(get_db)):
         )
 
 
-@app.post("/attendance", response_model=AttendanceResponse, status_code=status.HTTP_201_CREATED)
+@router.post("/attendance", response_model=AttendanceResponse, status_code=status.HTTP_201_CREATED)
 def create_attendance_endpoint(attendance: AttendanceCreate, db: Session = Depends(get_db)):
     """
     Create an attendance record.
@@ -116,8 +125,27 @@ def create_attendance_endpoint(attendance: AttendanceCreate, db: Session = Depen
         422: Validation error (invalid status or date format)
     """
     try:
-        db_attendance = create_attendance(db, attendance)
-        return AttendanceResponse.from_orm(db_attendance)
+        return create_attendance(db, attendance)
+    except EmployeeNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+
+
+@router.post("/attendance/bulk", response_model=AttendanceBulkResponse, status_code=status.HTTP_201_CREATED)
+def create_attendance_bulk_endpoint(attendance: List[AttendanceCreate], db: Session = Depends(get_db)):
+    """
+    Create many attendance records in one request.
+    
+    Returns:
+        201: Attendance recorded successfully, with the number of records created
+        404: One or more employees not found
+        422: Validation error (invalid status or date format)
+    """
+    try:
+        created = create_attendance_bulk(db, attendance)
+        return {"created": created}
     except EmployeeNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -125,18 +153,26 @@ def create_attendance_endpoint(attendance: AttendanceCreate, db: Session = Depen
         )
 
 
-@app.get("/attendance/{employee_id}", response_model=List[AttendanceResponse])
-def get_attendance_endpoint(employee_id: str, db: Session = Depends(get_db)):
+@router.get("/attendance/{employee_id}", response_model=List[AttendanceResponse])
+def get_attendance_endpoint(
+    employee_id: str,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1),
+    db: Session = Depends(get_db)
+):
     """
-    Retrieve all attendance records for a specific employee.
+    Retrieve a page of attendance records for a specific employee.
+    
+    The page size is capped at MAX_ATTENDANCE_PAGE_SIZE records.
     
     Returns:
         200: List of attendance records sorted by date (newest first)
         404: Employee not found
     """
+    limit = min(limit, MAX_ATTENDANCE_PAGE_SIZE)
     try:
-        attendance_records = get_attendance_by_employee(db, employee_id)
-        return [AttendanceResponse.from_orm(record) for record in attendance_records]
+        attendance_records = get_attendance_by_employee(db, employee_id, skip, limit)
+        return attendance_records
     except EmployeeNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -144,7 +180,7 @@ def get_attendance_endpoint(employee_id: str, db: Session = Depends(get_db)):
         )
 
 
-@app.get("/dashboard/stats")
+@router.get("/dashboard/stats")
 def get_dashboard_stats(db: Session = Depends(get_db)):
     """
     Get aggregated dashboard statistics in a single call.
@@ -152,26 +188,34 @@ def get_dashboard_stats(db: Session = Depends(get_db)):
     Returns:
         200: Dashboard statistics including employee count, attendance summary, etc.
     """
-    from sqlalchemy import func
+    from sqlalchemy import func, case, and_
     from datetime import date
     
-    # Get total employees
-    total_employees = db.query(Employee).count()
+    # Serve recent statistics from memory; mutations invalidate the cache
+    cached = get_cached_dashboard_stats()
+    if cached is not None:
+        return cached
+    generation = dashboard_stats_generation()
     
-    # Get total attendance records
-    total_attendance = db.query(Attendance).count()
+    # Get total employees
+    total_employees = db.query(func.count(Employee.employee_id)).scalar()
     
-    # Get today's attendance
+    # Get total attendance records and today's attendance in one aggregate query
     today = date.today()
-    today_present = db.query(Attendance).filter(
-        Attendance.date == today,
-        Attendance.status == AttendanceStatus.Present
-    ).count()
     
-    today_absent = db.query(Attendance).filter(
-        Attendance.date == today,
-        Attendance.status == AttendanceStatus.Absent
-    ).count()
+    def count_today(attendance_status):
+        return func.coalesce(func.sum(case(
+            (and_(Attendance.date == today, Attendance.status == attendance_status), 1),
+            else_=0
+        )), 0)
+    
+    total_attendance, today_present, today_absent = db.query(
+        func.count(Attendance.id),
+        count_today(AttendanceStatus.Present),
+        count_today(AttendanceStatus.Absent)
+    ).one()
+    # MySQL returns SUM() as DECIMAL, normalise to plain integers
+    today_present, today_absent = int(today_present), int(today_absent)
     
     # Get department distribution
     dept_distribution = db.query(
@@ -181,19 +225,24 @@ def get_dashboard_stats(db: Session = Depends(get_db)):
     
     departments = [{"name": dept, "count": count} for dept, count in dept_distribution]
     
-    # Get recent attendance (last 5 records)
-    recent_attendance = db.query(Attendance).join(Employee).order_by(
+    # Get recent attendance (last 5 records), selecting only the columns shown
+    recent_attendance = db.query(
+        Attendance.employee_id,
+        Employee.name,
+        Attendance.date,
+        Attendance.status
+    ).join(Attendance.employee).order_by(
         Attendance.date.desc()
     ).limit(5).all()
     
     recent = [{
         "employee_id": record.employee_id,
-        "employee_name": record.employee.name,
-        "date": str(record.date),
+        "employee_name": record.name,
+        "date": record.date,
         "status": record.status.value
     } for record in recent_attendance]
     
-    return {
+    stats = {
         "total_employees": total_employees,
         "total_attendance": total_attendance,
         "present_today": today_present,
@@ -201,9 +250,10 @@ def get_dashboard_stats(db: Session = Depends(get_db)):
         "departments": departments,
         "recent_attendance": recent
     }
+    cache_dashboard_stats(stats, generation)
+    return stats
 
 
-@app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """
     Global exception handler for unhandled errors.
@@ -215,3 +265,37 @@ async def global_exception_handler(request, exc):
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={"detail": "An internal server error occurred"}
     )
+
+
+def create_app(frontend_url: Optional[str] = None) -> FastAPI:
+    """
+    Create the FastAPI application.
+    
+    Args:
+        frontend_url: Production frontend URL allowed by CORS, defaults to the FRONTEND_URL env variable
+        
+    Returns:
+        Configured FastAPI application
+    """
+    application = FastAPI(
+        title="HRMS Lite API",
+        description="REST API for Human Resource Management System",
+        version="1.0.0",
+        default_response_class=ORJSONResponse
+    )
+    
+    application.add_middleware(
+        CORSMiddleware,
+        allow_origins=get_cors_origins(frontend_url),
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    
+    application.add_event_handler("startup", startup_event)
+    application.add_exception_handler(Exception, global_exception_handler)
+    application.include_router(router)
+    return application
+
+
+app = create_app()
@@ -37,11 +37,13 @@ class Employee(Base):
     email = Column(String(100), nullable=False, index=True)
     department = Column(String(100), nullable=False, index=True)
 
-    # Relationship with cascade delete - when employee is deleted, all attendance records are deleted
+    # Relationship with cascade delete - when employee is deleted, all attendance records are deleted.
+    # passive_deletes leaves the delete to the database's ON DELETE CASCADE instead of loading children
     attendance_records = relationship(
         "Attendance",
         back_populates="employee",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
 
     # Composite index for common query patterns
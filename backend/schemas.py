@@ -4,9 +4,14 @@ Handles validation for employee and attendance data.
 """
 from pydantic import BaseModel, EmailStr, Field, field_validator
 from datetime import date as date_type
-from typing import Literal
 import re
 
+from models import AttendanceStatus
+
+
+# Accepted employee email format, compiled once at import
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 
 class EmployeeCreate(BaseModel):
     """Schema for creating a new employee."""
@@ -19,8 +24,7 @@ class EmployeeCreate(BaseModel):
     @classmethod
     def validate_email_format(cls, v: str) -> str:
         """Validate email format using regex pattern."""
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, v):
+        if not EMAIL_PATTERN.match(v):
             raise ValueError('Invalid email format')
         return v
 
@@ -40,7 +44,7 @@ class AttendanceCreate(BaseModel):
     """Schema for creating an attendance record."""
     employee_id: str = Field(..., min_length=1, description="Employee identifier")
     date: date_type = Field(..., description="Attendance date")
-    status: Literal["Present", "Absent"] = Field(..., description="Attendance status")
+    status: AttendanceStatus = Field(..., description="Attendance status (Present or Absent)")
 
 
 class AttendanceResponse(BaseModel):
@@ -48,17 +52,12 @@ class AttendanceResponse(BaseModel):
     id: int
     employee_id: str
     date: date_type
-    status: str
+    status: AttendanceStatus
 
     class Config:
         from_attributes = True
 
-    @classmethod
-    def from_orm(cls, obj):
-        """Convert ORM object to response, handling enum status."""
-        return cls(
-            id=obj.id,
-            employee_id=obj.employee_id,
-            date=obj.date,
-            status=obj.status.value if hasattr(obj.status, 'value') else obj.status
-        )
+
+class AttendanceBulkResponse(BaseModel):
+    """Schema for bulk attendance creation response."""
+    created: int
@@ -2,6 +2,9 @@
 
 const API_BASE_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 
+// Page size requested for attendance history; the backend may serve fewer
+const ATTENDANCE_PAGE_SIZE = 500;
+
 // Employee API functions
 export const employeeAPI = {
   // Get all employees
@@ -59,12 +62,23 @@ export const attendanceAPI = {
     return response.json();
   },
 
-  // Get attendance records for a specific employee
+  // Get all attendance records for a specific employee (newest first),
+  // following pages until the server returns an empty one
   getByEmployee: async (employeeId) => {
-    const response = await fetch(`${API_BASE_URL}/attendance/${employeeId}`);
-    if (!response.ok) {
-      throw new Error('Failed to fetch attendance records');
+    const records = [];
+    for (let skip = 0; ; ) {
+      const response = await fetch(
+        `${API_BASE_URL}/attendance/${employeeId}?skip=${skip}&limit=${ATTENDANCE_PAGE_SIZE}`
+      );
+      if (!response.ok) {
+        throw new Error('Failed to fetch attendance records');
+      }
+      const page = await response.json();
+      if (page.length === 0) {
+        return records;
+      }
+      records.push(...page);
+      skip += page.length;
     }
-    return response.json();
   },
 };